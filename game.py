@@ -3,11 +3,14 @@ Game - Core game state and update logic
 Manages the main game loop, timing, scoring, and state transitions.
 """
 
+import curses
 import time
 from player import Player
 from level import Level
 from renderer import Renderer
 
+_K_SPACE, _K_R, _K_r, _K_Q, _K_q = map(ord, ' RrQq')
+
 class Game:
     """Core game state and update logic."""
     
@@ -20,6 +23,10 @@ class Game:
         self.base_tick_interval = 0.050  # ~20 ticks per second (deliberate pace)
         self.tick_interval = self.base_tick_interval
         self.tick_counter = 0
+        self.idle_tick_interval = 0.100  # Slower polling on game-over screen
+        
+        # Redraw gate — frames are skipped while nothing changes
+        self._dirty = True
         
         # Speed progression (very gradual)
         self.speed_multiplier = 1.0
@@ -39,44 +46,66 @@ class Game:
         self.level = Level(self.height, self.width)
         self.renderer = Renderer(stdscr, self.height, self.width)
         
+        # Fixed timestep — absolute monotonic deadline for the next tick
+        self._next_tick = time.monotonic_ns()
+        self._set_tick_length()
+        
     def run(self):
-        """Main game loop with fixed tick timing."""
+        """Main game loop with fixed tick timing.
+
+        getch() waits out whatever is left of the current tick, so keys
+        are handled as they arrive while update/render stay on the
+        tick deadline.
+        """
+        now = time.monotonic_ns()
+        self._next_tick = now
         while self.running:
-            tick_start = time.time()
-            
+            # Ceil to whole ms; 0 just polls when the tick is already due
+            wait_ms = max(0, -((now - self._next_tick) // 1_000_000))
+            self.stdscr.timeout(wait_ms)
             self.handle_input()
+            
+            now = time.monotonic_ns()
+            if now < self._next_tick:
+                continue  # Key arrived mid-tick — keep waiting
+            
+            # Advance the deadline; if a whole tick behind, resync instead
+            # of bursting through the missed ticks
+            self._next_tick = max(self._next_tick + self._tick_ns, now)
+            if self.game_over and not self._dirty:
+                continue  # Idle game-over screen — nothing to update or draw
             self.update()
             self.render()
-            
-            # Maintain constant tick rate
-            elapsed = time.time() - tick_start
-            sleep_time = self.tick_interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+    
+    def _set_tick_length(self):
+        """Recompute tick length — slower while idle on game over."""
+        interval = self.idle_tick_interval if self.game_over else self.tick_interval
+        self._tick_ns = int(interval * 1e9)
     
     def handle_input(self):
-        """Non-blocking input — SPACE taps to jump, R restarts, Q quits."""
-        try:
-            key = self.stdscr.getch()
-            
-            if key == ord(' '):
-                if not self.game_over:
-                    self.player.tap_jump()
+        """Handle one key (if any) — SPACE taps to jump, R restarts, Q quits."""
+        key = self.stdscr.getch()
+        if key < 0:
+            return  # Timed out — no key this tick
+
+        if key == _K_SPACE:
+            if not self.game_over:
+                self.player.tap_jump()
 
-            elif key == ord('r') or key == ord('R'):
-                if self.game_over:
-                    self.reset()
-                    
-            elif key == ord('q') or key == ord('Q'):
-                self.running = False
-        except:
-            pass
+        elif key == _K_R or key == _K_r:
+            if self.game_over:
+                self.reset()
+
+        elif key == _K_Q or key == _K_q:
+            self.running = False
     
     def update(self):
         """Update game state."""
         if self.game_over:
             return
         
+        self._dirty = True
+        
         # Update player
         self.player.update()
         
@@ -86,6 +115,7 @@ class Game:
         # Check collision
         if self.check_collision():
             self.game_over = True
+            self._set_tick_length()
             if self.distance_score > self.best_score:
                 self.best_score = self.distance_score
             return
@@ -101,43 +131,44 @@ class Game:
                 self.max_speed_multiplier
             )
             self.tick_interval = self.base_tick_interval / self.speed_multiplier
+            self._set_tick_length()
     
     def check_collision(self):
-        """Check if player collides with obstacle."""
-        player_x = self.player.x
-        player_y = int(self.player.y)  # Round to nearest grid position
-        platform_row = self.height - 3
-        
-        # Check if player position has obstacle
-        if self.level.has_obstacle_at(player_x, player_y):
-            return True
-        
-        # Check if player fell into a gap (no platform below when on ground)
-        if player_y >= platform_row:  # Player is at or below platform level
-            # Check if there's actually a platform
-            platform_char = self.level.get_char_at(player_x, platform_row)
-            if platform_char == ' ':
-                # Player is over a gap with no platform
-                return True
-        
-        return False
+        """Check if player hit an obstacle or fell into a gap."""
+        return self.level.collide(self.player.x, self.player.int_y)
     
     def render(self):
-        """Render current game state."""
-        self.renderer.clear()
-        self.renderer.draw_hud(
-            self.distance_score,
-            self.best_score,
-            self.speed_multiplier,
-            self.game_over,
-            self.player.get_stamina_display()
-        )
-        self.renderer.draw_level(self.level)
-        self.renderer.draw_player(self.player)
-        # Draw game over LAST so nothing overlaps it
-        if self.game_over:
-            self.renderer.draw_game_over()
+        """Render current game state.
+
+        Every row is redrawn in full each frame, so the screen is not
+        cleared first and curses only sends the cells that changed.
+        Once the game-over screen has been drawn, frames are skipped
+        until something marks the game dirty again.
+        """
+        if not self._dirty:
+            return
+        
+        try:
+            self.renderer.draw_hud(
+                self.distance_score,
+                self.best_score,
+                self.speed_multiplier,
+                self.game_over,
+                self.player.get_stamina_display()
+            )
+            self.renderer.draw_level(self.level)
+            self.renderer.draw_player(self.player)
+            # Draw game over LAST so nothing overlaps it
+            if self.game_over:
+                self.renderer.draw_game_over()
+        except curses.error:
+            pass  # Terminal shrank mid-game — keep what was drawn
         self.renderer.refresh()
+        curses.doupdate()  # Single terminal write per frame
+        
+        # Game-over screen is static — paint it once
+        if self.game_over:
+            self._dirty = False
     
     def reset(self):
         """Reset game state for new run."""
@@ -146,7 +177,10 @@ class Game:
         self.distance_score = 0
         self.speed_multiplier = 1.0
         self.tick_interval = self.base_tick_interval
+        self._dirty = True
+        self._set_tick_length()
         
         # Reset components
         self.player.reset(self.height)
         self.level.reset()
+        self.renderer.clear()
@@ -4,6 +4,20 @@ All obstacles are clearable with a single tap jump. No impossible combos.
 """
 
 import random
+from bisect import bisect_right
+from itertools import accumulate
+
+# Cells are one-byte codes; GLYPHS maps them to screen chars.
+# Every foreground code sorts above every background code, so
+# max(fg, bg) composes a cell with the foreground drawn on top.
+EMPTY = ord(' ')
+STAR = ord('.')
+CLOUD_CODES = b'-+-'
+GROUND = ord('=')
+PLATFORM = ord('_')
+SPIKE = ord('^')
+BLOCK = ord('X')
+GLYPHS = str.maketrans('.-+_^X', '·~≈─▲█')
 
 
 class Level:
@@ -14,6 +28,18 @@ class Level:
         self.width = width
         self.grid_width = width - 1
 
+        self.platform_row = height - 3
+        self.ground_row = height - 2
+
+        # Obstacle rows → bit in the per-column obstacle mask
+        self.row_bits = {self.platform_row - i: 1 << i for i in range(3)}
+
+        # Rows that can ever hold a foreground cell; the rest are sky
+        self.foreground_rows = frozenset([*self.row_bits, self.ground_row])
+
+        # One grid column of empty cells, for strided column clears
+        self._blank_column = bytes([EMPTY]) * height
+
         # Background decoration
         self.star_positions = []
         self.cloud_positions = []
@@ -43,14 +69,20 @@ class Level:
         self.reset()
 
     def _build_weighted_pool(self):
-        """Build flat list for weighted random selection."""
-        self.pool = []
-        for name, weight in self.obstacle_types:
-            self.pool.extend([name] * weight)
+        """Build cumulative weights for weighted random selection."""
+        self.names = [name for name, _ in self.obstacle_types]
+        self.cum_weights = list(accumulate(w for _, w in self.obstacle_types))
+
+    def _pick_obstacle(self):
+        """Pick an obstacle type — one RNG call plus a bisect."""
+        r = self.rng.random() * self.cum_weights[-1]
+        return self.names[bisect_right(self.cum_weights, r)]
 
     def reset(self):
         """Reset level state."""
         self.grid = self._create_empty_grid()
+        self.head = 0                  # Physical column of logical x = 0
+        self.obstacle_mask = bytearray(self.grid_width)
         self.columns_until_next = 20   # Safe start zone
         self.gap_counter = 0
         self.double_spike_remaining = 0
@@ -62,6 +94,10 @@ class Level:
         for _ in range(self.grid_width):
             self._add_column()
 
+        # Platform/ground rows as ready-to-draw strings
+        self.platform_row_str = self._row_str(self.platform_row)
+        self.ground_row_str = self._row_str(self.ground_row)
+
     def _init_background(self):
         """Initialize stars and clouds."""
         bg_rng = random.Random(42)
@@ -79,108 +115,187 @@ class Level:
             width = bg_rng.randint(3, 6)
             self.cloud_positions.append([x, y, width])
 
+        self.bg_rows = [bytearray(b' ') * self.grid_width for _ in range(self.height)]
+        self._stamp_background()
+
+    def _stamp_background(self, erase=False):
+        """Stamp stars and clouds into bg_rows, or blank them when erasing.
+
+        Unlike the grid, the background is stored in screen order — its
+        parallax cadence differs from the 1 column/tick ring buffer.
+        Only the cells under stars and clouds are touched. Nothing is
+        stamped on the platform/ground rows, which are drawn from cached
+        foreground-only strings.
+        """
+        grid_width = self.grid_width
+        sky_end = self.platform_row
+        bg_rows = self.bg_rows
+        n_cloud_codes = len(CLOUD_CODES)
+
+        for star_x, star_y in self.star_positions:
+            if 0 <= star_x < grid_width and 1 <= star_y < sky_end:
+                bg_rows[star_y][star_x] = EMPTY if erase else STAR
+
+        for cloud_x, cloud_y, cloud_width in self.cloud_positions:
+            if not 1 <= cloud_y < sky_end:
+                continue
+            row = bg_rows[cloud_y]
+            for i in range(cloud_width):
+                x = cloud_x + i
+                if 0 <= x < grid_width:
+                    row[x] = EMPTY if erase else CLOUD_CODES[i % n_cloud_codes]
+
     def _create_empty_grid(self):
-        """Create empty grid."""
-        grid = []
-        for y in range(self.height):
-            grid.append([' '] * self.grid_width)
+        """Create empty grid.
+
+        The grid is a flat bytearray ring buffer of `height * grid_width`
+        cell codes.
+        Logical column x lives at physical column (head + x) % grid_width,
+        so scrolling only moves `head` instead of copying every row.
+        """
+        grid_width = self.grid_width
+        grid = bytearray(b' ') * (self.height * grid_width)
 
-        ground_row = self.height - 2
-        platform_row = self.height - 3
+        ground_start = (self.height - 2) * grid_width
+        platform_start = (self.height - 3) * grid_width
 
-        for x in range(self.grid_width):
-            grid[ground_row][x] = '='
-            grid[platform_row][x] = '─'
+        grid[ground_start:ground_start + grid_width] = bytes([GROUND]) * grid_width
+        grid[platform_start:platform_start + grid_width] = bytes([PLATFORM]) * grid_width
 
         return grid
 
+    def _index(self, x, y):
+        """Flat grid index of logical column x (may be negative) on row y."""
+        return y * self.grid_width + (self.head + x) % self.grid_width
+
     def scroll(self):
         """Scroll level left and add new column."""
-        for y in range(self.height):
-            self.grid[y] = self.grid[y][1:] + [' ']
+        grid = self.grid
+        grid_width = self.grid_width
+
+        # Old leftmost column becomes the new rightmost one — blank it
+        self.head = (self.head + 1) % grid_width
+        tail = (self.head - 1) % grid_width
+        grid[tail::grid_width] = self._blank_column  # One strided C-level write
+        self.obstacle_mask[tail] = 0
 
         self.bg_scroll_counter += 1
-        if self.bg_scroll_counter % 3 == 0:
+        stars_moved = self.bg_scroll_counter % 3 == 0
+        clouds_moved = self.bg_scroll_counter % 2 == 0
+        bg_moved = stars_moved or clouds_moved
+
+        if bg_moved:
+            self._stamp_background(erase=True)
+
+        if stars_moved:
             for star in self.star_positions:
                 star[0] -= 1
                 if star[0] < 0:
-                    star[0] = self.grid_width - 1
+                    star[0] = grid_width - 1
 
-        if self.bg_scroll_counter % 2 == 0:
+        if clouds_moved:
             for cloud in self.cloud_positions:
                 cloud[0] -= 1
                 if cloud[0] < -cloud[2]:
-                    cloud[0] = self.grid_width - 1
+                    cloud[0] = grid_width - 1
+
+        if bg_moved:
+            self._stamp_background()
 
         self._add_column()
 
+        # Only the new rightmost cell of the cached rows changed
+        self.platform_row_str = self.platform_row_str[1:] + self._glyph_at(-1, self.platform_row)
+        self.ground_row_str = self.ground_row_str[1:] + self._glyph_at(-1, self.ground_row)
+
     def _add_column(self):
         """Add new column with fair random obstacles."""
-        ground_row = self.height - 2
-        platform_row = self.height - 3
+        ground_row = self.ground_row
+        platform_row = self.platform_row
+        ground = self._index(-1, ground_row)
+        platform = self._index(-1, platform_row)
+
+        # Platform cell is always rewritten below — drop its obstacle bit
+        self.obstacle_mask[(self.head - 1) % self.grid_width] &= ~self.row_bits[platform_row]
 
         # Handle active gap
         if self.gap_counter > 0:
-            self.grid[ground_row][-1] = ' '
-            self.grid[platform_row][-1] = ' '
+            self.grid[ground] = EMPTY
+            self.grid[platform] = EMPTY
             self.gap_counter -= 1
             return
 
         # Handle double spike follow-up
         if self.double_spike_remaining > 0:
             self.double_spike_remaining -= 1
-            self.grid[ground_row][-1] = '='
-            self.grid[platform_row][-1] = '─'
+            self.grid[ground] = GROUND
+            self.grid[platform] = PLATFORM
             if self.double_spike_remaining == 0:
-                self.grid[platform_row][-1] = '▲'
+                self._set_obstacle(platform_row, SPIKE)
             return
 
         # Default: ground + platform
-        self.grid[ground_row][-1] = '='
-        self.grid[platform_row][-1] = '─'
+        self.grid[ground] = GROUND
+        self.grid[platform] = PLATFORM
 
         self.columns_until_next -= 1
 
         if self.columns_until_next <= 0:
-            element_type = self.rng.choice(self.pool)
+            element_type = self._pick_obstacle()
             self._place_obstacle(element_type, platform_row, ground_row)
             self.columns_until_next = self.rng.randint(self.min_spacing, self.max_spacing)
 
     def _place_obstacle(self, element_type, platform_row, ground_row):
         """Place a fair obstacle at the rightmost column."""
         if element_type == 'spike':
-            self.grid[platform_row][-1] = '▲'
+            self._set_obstacle(platform_row, SPIKE)
 
         elif element_type == 'double_spike':
-            self.grid[platform_row][-1] = '▲'
+            self._set_obstacle(platform_row, SPIKE)
             self.double_spike_remaining = 3  # 3 cols gap then second spike
 
         elif element_type == 'low_block':
             # 2 units high — easily clearable
-            self.grid[platform_row][-1] = '█'
+            self._set_obstacle(platform_row, BLOCK)
             if platform_row - 1 >= 1:
-                self.grid[platform_row - 1][-1] = '█'
+                self._set_obstacle(platform_row - 1, BLOCK)
 
         elif element_type == 'mid_block':
             # 3 units high — clearable with tap jump
-            self.grid[platform_row][-1] = '█'
+            self._set_obstacle(platform_row, BLOCK)
             for i in range(1, 3):
                 if platform_row - i >= 1:
-                    self.grid[platform_row - i][-1] = '█'
+                    self._set_obstacle(platform_row - i, BLOCK)
 
         elif element_type == 'gap':
             gap_size = self.rng.randint(3, 4)  # Small gaps only
             self.gap_counter = gap_size
-            self.grid[ground_row][-1] = ' '
-            self.grid[platform_row][-1] = ' '
+            self.grid[self._index(-1, ground_row)] = EMPTY
+            self.grid[self._index(-1, platform_row)] = EMPTY
+
+    def _set_obstacle(self, y, code):
+        """Write an obstacle code to the rightmost column and flag it in the mask."""
+        self.grid[self._index(-1, y)] = code
+        self.obstacle_mask[(self.head - 1) % self.grid_width] |= self.row_bits[y]
 
     def has_obstacle_at(self, x, y):
         """Check if obstacle exists at position."""
         if x < 0 or x >= self.grid_width:
             return False
-        if y < 0 or y >= self.height:
-            return False
-        return self.grid[y][x] in ['█', '▲', '◆']
+        column = self.obstacle_mask[(self.head + x) % self.grid_width]
+        return bool(column & self.row_bits.get(y, 0))
+
+    def collide(self, x, y):
+        """Check if a player at (x, y) hits an obstacle or falls into a gap."""
+        grid_width = self.grid_width
+        platform_row = self.platform_row
+        if x < 0 or x >= grid_width:
+            return y >= platform_row  # Off-grid reads as a gap
+
+        col = (self.head + x) % grid_width
+        if self.obstacle_mask[col] & self.row_bits.get(y, 0):
+            return True
+        return y >= platform_row and self.grid[platform_row * grid_width + col] == EMPTY
 
     def get_char_at(self, x, y):
         """Get character at grid position."""
@@ -188,7 +303,35 @@ class Level:
             return ' '
         if y < 0 or y >= self.height:
             return ' '
-        return self.grid[y][x]
+        return self._glyph_at(x, y)
+
+    def _glyph_at(self, x, y):
+        """Screen character of logical cell (x, y), no bounds check."""
+        return chr(self.grid[self._index(x, y)]).translate(GLYPHS)
+
+    def _row_str(self, y):
+        """Foreground row y as a screen string."""
+        return self.get_row(y).decode('ascii').translate(GLYPHS)
+
+    def get_row(self, y):
+        """Get foreground row y as cell codes in screen order."""
+        start = y * self.grid_width
+        row = self.grid[start:start + self.grid_width]
+        return row[self.head:] + row[:self.head]
+
+    def compose_row(self, y):
+        """Get row y as a screen string — foreground over background.
+
+        Only rows holding both layers need the cell-by-cell overlay;
+        every other row is decoded straight from its one layer.
+        """
+        bg = self.bg_rows[y]
+        if y not in self.foreground_rows:
+            row = bg
+        else:
+            fg = self.get_row(y)
+            row = fg if bg.isspace() else bytes(map(max, fg, bg))
+        return row.decode('ascii').translate(GLYPHS)
 
     def get_background_elements(self):
         """Get background stars and clouds for rendering."""
@@ -7,10 +7,8 @@ def main(stdscr):
     """Main entry point - initializes curses and runs game loop."""
     # Curses setup
     curses.curs_set(0)  # Hide cursor
-    stdscr.nodelay(1)   # Non-blocking input
-    stdscr.timeout(0)   # No input delay
     
-    # Initialize game
+    # Initialize game (sets the getch() timeout that paces each tick)
     game = Game(stdscr)
     
     # Run game loop
@@ -6,6 +6,10 @@ Stamina recharges while on the ground.
 
 import time
 
+# Physics runs in integer fixed point: 1 row == 1 << FP_SHIFT units
+FP_SHIFT = 8
+FP_ONE = 1 << FP_SHIFT
+
 
 class Player:
     """Player with tap jump and stamina system."""
@@ -19,13 +23,14 @@ class Player:
         """Reset player state."""
         self.screen_height = screen_height
         self.ground_y = screen_height - 3  # Platform layer
-        self.y = float(self.ground_y)
+        self.y_q = self.ground_y << FP_SHIFT
+        self.int_y = self.ground_y         # Grid row (y_q >> FP_SHIFT)
 
-        # Physics
-        self.velocity_y = 0.0
-        self.gravity = 0.8               # Gravity (user-tuned)
-        self.jump_impulse = -3.5         # Fixed upward impulse per tap
-        self.max_height = 3              # Hard ceiling row
+        # Physics (fixed point, see FP_SHIFT)
+        self.vy_q = 0
+        self.gravity_q = round(0.8 * FP_ONE)        # Gravity (user-tuned)
+        self.jump_impulse_q = round(-3.5 * FP_ONE)  # Fixed upward impulse per tap
+        self.max_height = 3                         # Hard ceiling row
 
         # Jump state
         self.on_ground = True
@@ -33,6 +38,11 @@ class Player:
         # Stamina system
         self.max_stamina = 5
         self.stamina = self.max_stamina
+        # Prebuilt HUD bars, indexed by stamina
+        self._stamina_strs = [
+            f"[{'■' * i}{'□' * (self.max_stamina - i)}]"
+            for i in range(self.max_stamina + 1)
+        ]
 
         # Air-push particles (visual only)
         # Each particle: [x, y, lifetime]  (lifetime counts down)
@@ -62,14 +72,14 @@ class Player:
         was_airborne = not self.on_ground
 
         # Jump! (resets velocity — not additive)
-        self.velocity_y = self.jump_impulse
+        self.vy_q = self.jump_impulse_q
         self.on_ground = False
         self.stamina -= 1
         self.last_jump_time = now
 
         # Spawn air-push particles on mid-air jumps
         if was_airborne:
-            py = int(self.y)
+            py = self.int_y
             # Burst of particles below the player
             self.air_particles.append([self.x, py + 1, 4])     # ↓ right below
             self.air_particles.append([self.x - 1, py + 1, 3]) # left
@@ -84,30 +94,37 @@ class Player:
 
     def update(self):
         """Update position with gravity. Tick air particles."""
-        # Tick particles
-        self.air_particles = [
-            [x, y, life - 1] for x, y, life in self.air_particles if life > 1
-        ]
+        # Tick particles in place (usually empty — no allocation then)
+        particles = self.air_particles
+        if particles:
+            for i in range(len(particles) - 1, -1, -1):
+                particle = particles[i]
+                if particle[2] > 1:
+                    particle[2] -= 1
+                else:
+                    del particles[i]
 
         if not self.on_ground:
             # Apply gravity
-            self.velocity_y += self.gravity
+            self.vy_q += self.gravity_q
 
             # Update position
-            self.y += self.velocity_y
+            self.y_q += self.vy_q
 
             # Hard ceiling cap
-            if self.y < self.max_height:
-                self.y = float(self.max_height)
-                self.velocity_y = 0.0
+            if self.y_q < self.max_height << FP_SHIFT:
+                self.y_q = self.max_height << FP_SHIFT
+                self.vy_q = 0
 
             # Ground landing — full stamina recharge
-            if self.y >= self.ground_y:
-                self.y = float(self.ground_y)
-                self.velocity_y = 0.0
+            if self.y_q >= self.ground_y << FP_SHIFT:
+                self.y_q = self.ground_y << FP_SHIFT
+                self.vy_q = 0
                 self.on_ground = True
                 self.stamina = self.max_stamina  # Full recharge on touch
 
+            self.int_y = self.y_q >> FP_SHIFT
+
     # ------------------------------------------------------------------
     # Display helpers
     # ------------------------------------------------------------------
@@ -122,6 +139,4 @@ class Player:
 
     def get_stamina_display(self):
         """Return stamina bar string for HUD."""
-        filled = '■' * self.stamina
-        empty = '□' * (self.max_stamina - self.stamina)
-        return f"[{filled}{empty}]"
+        return self._stamina_strs[self.stamina]
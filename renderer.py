@@ -1,8 +1,13 @@
 """
 Renderer - Display logic
 Handles all screen drawing operations without mutating game state.
+Writes are clamped to the screen and never touch the last column, so
+addstr cannot hit the bottom-right corner error.
 """
 
+import curses
+
+
 class Renderer:
     """Handles all rendering to screen."""
     
@@ -10,92 +15,79 @@ class Renderer:
         self.stdscr = stdscr
         self.height = height
         self.width = width
+        self.max_x = width - 1   # Last writable column is max_x - 1
+        self.max_y = height - 1
+
+        # Off-screen buffer — frames are composed here, then copied to
+        # stdscr in one go so a half-drawn frame is never shown
+        self.pad = curses.newpad(height, width)
+
+        # HUD text cache — rebuilt only when its inputs change
+        self._hud_key = None
+        self._hud_row = ""
     
     def clear(self):
-        """Clear screen buffer."""
-        self.stdscr.clear()
+        """Clear screen buffer (erase — no forced full repaint)."""
+        self.pad.erase()
     
     def refresh(self):
-        """Refresh screen display."""
-        try:
-            self.stdscr.refresh()
-        except:
-            pass  # Ignore refresh errors
+        """Copy the finished frame to stdscr and stage it for curses.doupdate()."""
+        self.pad.overwrite(self.stdscr)
+        self.stdscr.noutrefresh()
     
     def draw_hud(self, score, best_score, speed, game_over, stamina_display=""):
         """Draw HUD at top of screen."""
-        try:
-            hud_left = f"Score: {score}  Best: {best_score}  Speed: {speed:.1f}x"
-            hud_right = f"Stamina {stamina_display}"
-            self.stdscr.addstr(0, 1, hud_left)
-            # Right-align stamina
-            right_x = max(len(hud_left) + 4, self.width - len(hud_right) - 2)
-            if right_x < self.width - 1:
-                self.stdscr.addstr(0, right_x, hud_right)
-        except:
-            pass
+        hud_key = (score, best_score, speed, stamina_display)
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+            self._hud_row = self._build_hud_row(score, best_score, speed, stamina_display)
+        self.pad.addstr(0, 0, self._hud_row)
+
+    def _build_hud_row(self, score, best_score, speed, stamina_display):
+        """Compose the full-width HUD row (padded, so it also erases)."""
+        hud_left = f"Score: {score}  Best: {best_score}  Speed: {speed:.1f}x"
+        hud_right = f"Stamina {stamina_display}"
+        row = ' ' + hud_left
+        # Right-align stamina
+        right_x = max(len(hud_left) + 4, self.width - len(hud_right) - 2)
+        if right_x < self.max_x:
+            row = row.ljust(right_x) + hud_right
+        return row[:self.max_x].ljust(self.max_x)
     
     def draw_game_over(self):
         """Draw game over text LAST so nothing overlaps it."""
-        try:
-            game_over_text = "GAME OVER - Press R to restart, Q to quit"
-            x_pos = max(0, (self.width - len(game_over_text)) // 2)
-            row = self.height // 2
-            # Clear the row first so no background bleeds through
-            self.stdscr.addstr(row, 0, ' ' * (self.width - 1))
-            self.stdscr.addstr(row, x_pos, game_over_text)
-        except:
-            pass
+        game_over_text = "GAME OVER - Press R to restart, Q to quit"
+        x_pos = max(0, (self.width - len(game_over_text)) // 2)
+        # Pad the whole row so no background bleeds through
+        row = (' ' * x_pos + game_over_text)[:self.max_x].ljust(self.max_x)
+        self.pad.addstr(min(self.height // 2, self.max_y), 0, row)
     
     def draw_level(self, level):
-        """Draw level grid with background."""
-        # Draw background first
-        bg_elements = level.get_background_elements()
-        
-        # Draw stars
-        for star_x, star_y in bg_elements['stars']:
-            if 0 <= star_x < level.grid_width and 1 <= star_y < self.height:
-                try:
-                    self.stdscr.addstr(star_y, star_x, '·')
-                except:
-                    pass
-        
-        # Draw clouds
-        for cloud_x, cloud_y, cloud_width in bg_elements['clouds']:
-            cloud_chars = ['~', '≈', '~']
-            for i in range(cloud_width):
-                x = cloud_x + i
-                if 0 <= x < level.grid_width and 1 <= cloud_y < self.height:
-                    try:
-                        char = cloud_chars[i % len(cloud_chars)]
-                        self.stdscr.addstr(cloud_y, x, char)
-                    except:
-                        pass
-        
-        # Draw foreground obstacles and platforms
+        """Draw level grid over its background, one addstr per row.
+
+        Platform and ground rows come prebuilt from the level.
+        """
+        addstr = self.pad.addstr
+        compose_row = level.compose_row
+        platform_row = level.platform_row
+        ground_row = level.ground_row
         for y in range(1, self.height):  # Skip HUD row
-            for x in range(level.grid_width):
-                char = level.get_char_at(x, y)
-                if char not in [' ', '·', '~', '≈']:  # Don't overwrite background
-                    try:
-                        self.stdscr.addstr(y, x, char)
-                    except:
-                        pass
+            if y == platform_row:
+                row = level.platform_row_str
+            elif y == ground_row:
+                row = level.ground_row_str
+            else:
+                row = compose_row(y)
+            addstr(y, 0, row)
     
     def draw_player(self, player):
         """Draw player character and air-push particles."""
-        try:
-            y_pos = int(player.y)
-            self.stdscr.addstr(y_pos, player.x, player.get_char())
-        except:
-            pass
+        y_pos = min(max(player.int_y, 0), self.max_y)
+        x_pos = min(max(player.x, 0), self.max_x - 1)
+        self.pad.addstr(y_pos, x_pos, player.get_char())
 
         # Draw air-push particles
         particle_chars = {4: '↓', 3: '∵', 2: '·', 1: '˙'}
         for px, py, life in player.air_particles:
-            if 1 <= py < self.height - 1 and 0 <= px < self.width - 1:
-                ch = particle_chars.get(life, '·')
-                try:
-                    self.stdscr.addstr(py, px, ch)
-                except:
-                    pass
+            if 1 <= py < self.max_y and 0 <= px < self.max_x:
+                self.pad.addstr(py, px, particle_chars.get(life, '·'))